@@ -28,8 +28,16 @@ from .scorer_v2 import (
 ListingGrader = ListingGraderV2
 GradeResult = GradeResultV2
 
-# v1 - Legacy (kept for backward compatibility)
-from .grader import ListingGrader as ListingGraderV1
+
+def __getattr__(name):
+    # v1 - Legacy (kept for backward compatibility), imported on first use
+    # so the CLI and v2 users don't pay for loading the v1 modules
+    if name == "ListingGraderV1":
+        from .grader import ListingGrader as ListingGraderV1
+        globals()["ListingGraderV1"] = ListingGraderV1
+        return ListingGraderV1
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # v2 - Recommended
@@ -0,0 +1,68 @@
+"""
+Shared results for async lookups (host profiles, market searches)
+"""
+
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+from typing import Awaitable, Callable, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FutureCache:
+    """
+    Results of async lookups, shared by every caller asking for the same key.
+
+    Each lookup runs as its own task, so concurrent callers wait on one
+    request and cancelling one caller never cancels it for the others.
+    Failed lookups are not kept - the next caller for that key retries.
+
+    Results are reused for `ttl` seconds, and at most `maxsize` keys are
+    kept (oldest dropped first), so a long-lived grader neither serves
+    stale data forever nor grows without bound.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expiry time, future), oldest first
+        self._entries: "OrderedDict[Hashable, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Result for key, starting fetch() unless a lookup is cached or running"""
+        now = monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            future = entry[1]
+        else:
+            future = asyncio.ensure_future(fetch())
+            future.add_done_callback(lambda f: self._drop_failed(key, f))
+            self._entries[key] = (now + self.ttl, future)
+            self._entries.move_to_end(key)
+            self._prune(now)
+
+        return await asyncio.shield(future)
+
+    def _drop_failed(self, key: Hashable, future: asyncio.Future):
+        # Runs even when every caller was cancelled; reading the exception
+        # also stops asyncio logging "Future exception was never retrieved"
+        if future.cancelled() or future.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
+
+    def _prune(self, now: float):
+        # Every entry lives for the same ttl, so expired ones are at the front
+        while self._entries:
+            expires, _ = next(iter(self._entries.values()))
+            if expires > now and len(self._entries) <= self.maxsize:
+                break
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached result (running lookups still finish)"""
+        self._entries.clear()
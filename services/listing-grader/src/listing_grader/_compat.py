@@ -0,0 +1,24 @@
+"""
+Python version and optional dependency compatibility helpers
+"""
+
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional: pip install listing-grader[fast]
+    orjson = None
+
+# dataclass(**DATACLASS_SLOTS): __slots__ instances on Python 3.10+,
+# plain dataclasses on older interpreters
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def dumps_json(obj, indent: bool = False) -> str:
+    """Serialize to JSON (2-space indented if asked), using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
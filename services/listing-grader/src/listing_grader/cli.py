@@ -5,101 +5,177 @@ Command line interface - Airbnb Algorithm Aligned
 
 import argparse
 import asyncio
-import json
 import sys
 from typing import Optional
 
+from ._compat import dumps_json
 from .grader_v2 import ListingGraderV2, GradeResultV2
+from .scorer_v2 import score_to_grade
 
 
-def print_grade_report(result: GradeResultV2, verbose: bool = False):
-    """Pretty print Airbnb-aligned grade report"""
-    
-    grade_emoji = {
-        "A+": "🏆", "A": "⭐", "A-": "⭐",
-        "B+": "👍", "B": "👍", "B-": "👍",
-        "C+": "📊", "C": "📊", "C-": "📊",
-        "D+": "⚠️", "D": "⚠️", "D-": "⚠️",
-        "F": "❌"
-    }
+# Score bar strings, indexed by filled cells (score // 5)
+BARS20 = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+GRADE_EMOJI = {
+    "A+": "🏆", "A": "⭐", "A-": "⭐",
+    "B+": "👍", "B": "👍", "B-": "👍",
+    "C+": "📊", "C": "📊", "C-": "📊",
+    "D+": "⚠️", "D": "⚠️", "D-": "⚠️",
+    "F": "❌"
+}
+
+# (grade, emoji) indexed by score // 5 - grade thresholds are multiples of 5
+GRADE_TABLE = tuple(
+    (score_to_grade(i * 5), GRADE_EMOJI[score_to_grade(i * 5)]) for i in range(21)
+)
+_SEP65 = "=" * 65
+
+_REPORT_HEADER = (
+    f"\n{_SEP65}\n"
+    "🏠 AIRBNB VISIBILITY SCORE - Algorithm Aligned (2025)\n"
+    f"{_SEP65}"
+)
+
+_FACTORS_HEADER = (
+    "\n📊 RANKING FACTORS (Airbnb Algorithm Weights):\n"
+    f"   {'Factor':<20} {'Score':>6} {'Weight':>8} {'Impact':>10}\n"
+    f"   {'-' * 48}"
+)
+
+_SUMMARY_HEADER = (
+    f"\n{_SEP65}\n"
+    "📊 SUMMARY\n"
+    f"{_SEP65}\n"
+    f"{'Listing':<40} {'Score':>8} {'Grade':>6} {'GF?':>5}\n"
+    f"{'-' * 62}\n"
+)
+
+# Ranking factor rows: (label, GradeResultV2 attribute, algorithm weight %)
+_CATEGORY_SPEC = (
+    ("Reviews", "reviews_score", 25),
+    ("Response Time", "response_score", 15),
+    ("Pricing", "pricing_score", 15),
+    ("Conversion", "conversion_score", 12),
+    ("Instant Book", "instant_book_score", 10),
+    ("Cancellations", "cancellation_score", 8),
+    ("Listing Quality", "listing_quality_score", 8),
+    ("Availability", "availability_score", 7),
+)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def format_grade_report(result: GradeResultV2, verbose: bool = False) -> str:
+    """Render Airbnb-aligned grade report as a single string"""
     
-    emoji = grade_emoji.get(result.grade, "📊")
+    grade, emoji = GRADE_TABLE[min(20, result.overall_score // 5)]
+    out = []
     
-    print(f"\n{'='*65}")
-    print(f"🏠 AIRBNB VISIBILITY SCORE - Algorithm Aligned (2025)")
-    print(f"{'='*65}")
+    out.append(_REPORT_HEADER)
     
     name = result.listing_name[:55] + "..." if len(result.listing_name) > 55 else result.listing_name
-    print(f"📍 {name}")
-    print(f"🔗 {result.listing_url}")
-    print(f"{'='*65}")
+    out.append(f"📍 {name}")
+    out.append(f"🔗 {result.listing_url}")
+    out.append(_SEP65)
     
     # Overall score
-    print(f"\n{emoji} VISIBILITY SCORE: {result.overall_score}/100 (Grade: {result.grade})")
+    out.append(f"\n{emoji} VISIBILITY SCORE: {result.overall_score}/100 (Grade: {grade})")
     
-    filled = int(result.overall_score / 5)
-    bar = "█" * filled + "░" * (20 - filled)
-    print(f"   [{bar}]")
+    out.append(f"   [{BARS20[min(20, result.overall_score // 5)]}]")
     
     # Guest Favorites eligibility
     if result.guest_favorites_eligible:
-        print(f"\n   🏅 GUEST FAVORITES ELIGIBLE ✓")
+        out.append(f"\n   🏅 GUEST FAVORITES ELIGIBLE ✓")
     elif result.is_guest_favorite:
-        print(f"\n   🏅 GUEST FAVORITES BADGE ✓")
+        out.append(f"\n   🏅 GUEST FAVORITES BADGE ✓")
     else:
-        print(f"\n   ⚪ Not yet eligible for Guest Favorites")
+        out.append(f"\n   ⚪ Not yet eligible for Guest Favorites")
     
     # Category breakdown
-    print(f"\n📊 RANKING FACTORS (Airbnb Algorithm Weights):")
-    print(f"   {'Factor':<20} {'Score':>6} {'Weight':>8} {'Impact':>10}")
-    print(f"   {'-'*48}")
+    out.append(_FACTORS_HEADER)
     
-    categories = [
-        ("Reviews", result.reviews_score, 25),
-        ("Response Time", result.response_score, 15),
-        ("Pricing", result.pricing_score, 15),
-        ("Conversion", result.conversion_score, 12),
-        ("Instant Book", result.instant_book_score, 10),
-        ("Cancellations", result.cancellation_score, 8),
-        ("Listing Quality", result.listing_quality_score, 8),
-        ("Availability", result.availability_score, 7),
-    ]
-    
-    for name, score, weight in categories:
+    for name, attr, weight in _CATEGORY_SPEC:
+        score = getattr(result, attr)
         impact = score * weight / 100
-        bar = "█" * (score // 10) + "░" * (10 - score // 10)
-        print(f"   {name:<20} {score:>3}/100 {weight:>7}% {impact:>8.1f}pts")
+        out.append(f"   {name:<20} {score:>3}/100 {weight:>7}% {impact:>8.1f}pts")
     
     # Bonuses
     if result.superhost_bonus or result.guest_favorites_bonus:
-        print(f"\n🎁 BADGES & BONUSES:")
+        out.append(f"\n🎁 BADGES & BONUSES:")
         if result.superhost_bonus:
-            print(f"   ✓ Superhost: +{result.superhost_bonus} points")
+            out.append(f"   ✓ Superhost: +{result.superhost_bonus} points")
         if result.guest_favorites_bonus:
-            print(f"   ✓ Guest Favorites: +{result.guest_favorites_bonus} points")
+            out.append(f"   ✓ Guest Favorites: +{result.guest_favorites_bonus} points")
     
     # Key metrics
-    print(f"\n📋 KEY METRICS:")
-    print(f"   Rating: {result.rating}★ ({result.reviews_count} reviews)")
-    print(f"   Response: {result.response_rate}% rate, {result.response_time_hours}h avg")
-    print(f"   Instant Book: {'✓ Enabled' if result.instant_bookable else '✗ Disabled'}")
-    print(f"   Cancellation Rate: {result.cancellation_rate}%")
+    out.append(f"\n📋 KEY METRICS:")
+    out.append(f"   Rating: {result.rating}★ ({result.reviews_count} reviews)")
+    out.append(f"   Response: {result.response_rate}% rate, {result.response_time_hours}h avg")
+    out.append(f"   Instant Book: {'✓ Enabled' if result.instant_bookable else '✗ Disabled'}")
+    out.append(f"   Cancellation Rate: {result.cancellation_rate}%")
     
     # Market comparison
     if result.competitors_analyzed > 0:
-        print(f"\n📈 MARKET COMPARISON:")
-        print(f"   Market Avg Price: {result.market_avg_price:.0f}/night")
-        print(f"   Competitors Analyzed: {result.competitors_analyzed}")
+        out.append(f"\n📈 MARKET COMPARISON:")
+        out.append(f"   Market Avg Price: {result.market_avg_price:.0f}/night")
+        out.append(f"   Competitors Analyzed: {result.competitors_analyzed}")
     
     # Recommendations
     if result.recommendations:
-        print(f"\n💡 TOP ACTIONS TO IMPROVE RANKING:")
+        out.append(f"\n💡 TOP ACTIONS TO IMPROVE RANKING:")
         for i, rec in enumerate(result.recommendations[:8], 1):
-            print(f"   {i}. {rec}")
+            out.append(f"   {i}. {rec}")
+    
+    out.append(f"\n{_SEP65}")
+    out.append(f"Algorithm: {result.algorithm_version}")
+    out.append(f"{_SEP65}\n")
     
-    print(f"\n{'='*65}")
-    print(f"Algorithm: {result.algorithm_version}")
-    print(f"{'='*65}\n")
+    return "\n".join(out) + "\n"
+
+
+def print_grade_report(result: GradeResultV2, verbose: bool = False):
+    """Pretty print Airbnb-aligned grade report"""
+    sys.stdout.write(format_grade_report(result, verbose=verbose))
+
+
+async def _report_listing(
+    grader: ListingGraderV2,
+    url: str,
+    compare_market: bool = False,
+    output_json: bool = False,
+    verbose: bool = False,
+):
+    """Grade and print one listing with an open grader"""
+    try:
+        result = await grader.grade(
+            url,
+            compare_market=compare_market,
+        )
+        
+        if output_json:
+            print(dumps_json(result.to_dict(), indent=True))
+        else:
+            print_grade_report(result, verbose=verbose)
+        
+        return 0
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error grading listing: {e}", file=sys.stderr)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
 
 
 async def grade_listing(
@@ -111,27 +187,13 @@ async def grade_listing(
 ):
     """Grade a single listing"""
     async with ListingGraderV2(currency=currency) as grader:
-        try:
-            result = await grader.grade(
-                url,
-                compare_market=compare_market,
-            )
-            
-            if output_json:
-                print(json.dumps(result.to_dict(), indent=2))
-            else:
-                print_grade_report(result, verbose=verbose)
-            
-            return 0
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-        except Exception as e:
-            print(f"Error grading listing: {e}", file=sys.stderr)
-            if verbose:
-                import traceback
-                traceback.print_exc()
-            return 1
+        return await _report_listing(
+            grader,
+            url,
+            compare_market=compare_market,
+            output_json=output_json,
+            verbose=verbose,
+        )
 
 
 async def grade_batch(
@@ -139,28 +201,47 @@ async def grade_batch(
     compare_market: bool = False,
     output_json: bool = False,
     currency: str = "EUR",
+    concurrency: int = 20,
+    verbose: bool = False,
 ):
-    """Grade multiple listings"""
+    """Grade one or more listings (a single listing gets no summary)"""
     async with ListingGraderV2(currency=currency) as grader:
-        results = await grader.grade_batch(urls, compare_market=compare_market)
+        if len(urls) == 1:
+            return await _report_listing(
+                grader,
+                urls[0],
+                compare_market=compare_market,
+                output_json=output_json,
+                verbose=verbose,
+            )
         
         if output_json:
+            results = await grader.grade_batch(
+                urls,
+                compare_market=compare_market,
+                max_concurrent=concurrency,
+            )
             output = [r.to_dict() for r in results]
-            print(json.dumps(output, indent=2))
+            print(dumps_json(output, indent=True))
         else:
-            for result in results:
-                print_grade_report(result)
-            
-            # Summary
-            print(f"\n{'='*65}")
-            print(f"📊 SUMMARY")
-            print(f"{'='*65}")
-            print(f"{'Listing':<40} {'Score':>8} {'Grade':>6} {'GF?':>5}")
-            print(f"{'-'*62}")
-            for r in results:
+            # Print each report as soon as its listing is graded
+            summary = []
+            async for r in grader.grade_stream(
+                urls,
+                compare_market=compare_market,
+                max_concurrent=concurrency,
+            ):
+                sys.stdout.write(format_grade_report(r))
+                sys.stdout.flush()
+                
                 name = r.listing_name[:35] + "..." if len(r.listing_name) > 35 else r.listing_name
                 gf = "✓" if r.guest_favorites_eligible else "✗"
-                print(f"{name:<40} {r.overall_score:>5}/100 {r.grade:>6} {gf:>5}")
+                summary.append(f"{name:<40} {r.overall_score:>5}/100 {r.grade:>6} {gf:>5}\n")
+            
+            # Summary
+            out = [_SUMMARY_HEADER]
+            out.extend(summary)
+            sys.stdout.write("".join(out))
         
         return 0
 
@@ -183,6 +264,9 @@ Examples:
   
   # Grade multiple listings
   listing-grader url1 url2 url3
+  
+  # Grade a large batch, 50 listings at a time
+  listing-grader $(cat urls.txt) --concurrency 50
 
 Algorithm Weights (Airbnb 2025):
   Reviews/Guest Favorites  25%
@@ -226,6 +310,13 @@ Algorithm Weights (Airbnb 2025):
         help="Currency for pricing (default: EUR)"
     )
     
+    parser.add_argument(
+        "--concurrency", "-n",
+        type=_positive_int,
+        default=20,
+        help="Max listings graded at once in batch mode (default: 20)"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -234,22 +325,22 @@ Algorithm Weights (Airbnb 2025):
     
     args = parser.parse_args()
     
-    # Run async
-    if len(args.urls) == 1:
-        exit_code = asyncio.run(grade_listing(
-            args.urls[0],
-            compare_market=args.compare_market,
-            output_json=args.json,
-            verbose=args.verbose,
-            currency=args.currency,
-        ))
-    else:
-        exit_code = asyncio.run(grade_batch(
-            args.urls,
-            compare_market=args.compare_market,
-            output_json=args.json,
-            currency=args.currency,
-        ))
+    # Faster event loop when available (Linux/macOS)
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
+    # Run async - a single URL is just a batch of one
+    exit_code = run(grade_batch(
+        args.urls,
+        compare_market=args.compare_market,
+        output_json=args.json,
+        currency=args.currency,
+        concurrency=args.concurrency,
+        verbose=args.verbose,
+    ))
     
     sys.exit(exit_code)
 
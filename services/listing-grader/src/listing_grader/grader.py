@@ -4,15 +4,18 @@ Uses airbnb-scraper package for data extraction
 """
 
 import asyncio
+import bisect
 import logging
 import re
-from typing import Optional, List
-from dataclasses import asdict
+from itertools import chain, islice
+from typing import Optional, List, Tuple, Union
 
 from airbnb_scraper import AirbnbScraper, ListingBasic, ListingDetails
 
-from .models import ListingData, GradeResult, score_to_grade
+from ._cache import FutureCache
+from .models import ListingData, CategoryScore, GradeResult, score_to_grade
 from .scorer import (
+    extract_features,
     score_title,
     score_description,
     score_photos,
@@ -24,6 +27,12 @@ from .scorer import (
 
 logger = logging.getLogger(__name__)
 
+# Any URL that matches "airbnb.<tld>/rooms/<id>" also matches this
+_LISTING_ID_RE = re.compile(r'/rooms/(\d+)')
+
+# How long a market lookup (average price, competitor scores) is reused
+_MARKET_TTL = 900  # seconds
+
 
 class ListingGrader:
     """
@@ -52,6 +61,10 @@ class ListingGrader:
         self.currency = currency
         self.locale = locale
         self._scraper: Optional[AirbnbScraper] = None
+        # Market lookups per location bucket, shared by concurrent grade() calls
+        self._market_cache = FutureCache(ttl=_MARKET_TTL)
+        # Event loop reused by grade_sync() so the scraper session stays warm
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def _get_scraper(self) -> AirbnbScraper:
         """Get or create scraper instance"""
@@ -67,6 +80,7 @@ class ListingGrader:
         if self._scraper:
             await self._scraper.close()
             self._scraper = None
+        self._market_cache.clear()
     
     async def __aenter__(self):
         return self
@@ -79,15 +93,9 @@ class ListingGrader:
         if url_or_id.isdigit():
             return url_or_id
         
-        patterns = [
-            r'/rooms/(\d+)',
-            r'airbnb\.[^/]+/rooms/(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url_or_id)
-            if match:
-                return match.group(1)
+        match = _LISTING_ID_RE.search(url_or_id)
+        if match:
+            return match.group(1)
         
         raise ValueError(f"Invalid Airbnb URL or ID: {url_or_id}")
     
@@ -171,45 +179,25 @@ class ListingGrader:
         competitors_analyzed = 0
         competitor_scores = []
         
+        # Score the market-independent categories in a worker thread so
+        # concurrent grade() calls keep fetching while this one scores
+        loop = asyncio.get_running_loop()
+        content_scores = loop.run_in_executor(None, self._score_content, listing)
+        
         if compare_market and listing.latitude and listing.longitude:
             try:
-                competitors = await scraper.search_by_bounds(
-                    ne_lat=listing.latitude + 0.05,
-                    ne_lng=listing.longitude + 0.05,
-                    sw_lat=listing.latitude - 0.05,
-                    sw_lng=listing.longitude - 0.05,
-                    max_listings=30,
+                market_avg, competitors_analyzed, competitor_scores = await self._get_market(
+                    scraper, listing
                 )
-                
-                if competitors:
-                    prices = [c.price_per_night for c in competitors if c.price_per_night > 0]
-                    if prices:
-                        market_avg = sum(prices) / len(prices)
-                        competitors_analyzed = len(competitors)
-                        
-                        # Calculate competitor scores for percentile
-                        for comp in competitors:
-                            comp_listing = ListingData(
-                                listing_id=comp.airbnb_id,
-                                name=comp.name,
-                                images=comp.images,
-                                amenities=comp.amenities,
-                                rating=comp.rating,
-                                reviews_count=comp.reviews_count,
-                                is_superhost=comp.is_superhost,
-                            )
-                            comp_score = self._quick_score(comp_listing)
-                            competitor_scores.append(comp_score)
             except Exception as e:
                 logger.warning(f"Market comparison failed: {e}")
         
-        # Calculate category scores
-        title_result = score_title(listing)
-        desc_result = score_description(listing)
-        photos_result = score_photos(listing)
+        title_result, desc_result, photos_result, amenities_result, reviews_result = (
+            await content_scores
+        )
+        
+        # Pricing needs the market average
         pricing_result = score_pricing(listing, market_avg=market_avg)
-        amenities_result = score_amenities(listing)
-        reviews_result = score_reviews(listing)
         
         # Calculate overall score
         overall, superhost_bonus, instant_bonus = calculate_overall_score(
@@ -227,18 +215,19 @@ class ListingGrader:
         market_percentile = 50  # Default
         competitor_avg_score = None
         if competitor_scores:
-            better_than = sum(1 for s in competitor_scores if overall > s)
+            better_than = bisect.bisect_left(competitor_scores, overall)
             market_percentile = int((better_than / len(competitor_scores)) * 100)
             competitor_avg_score = int(sum(competitor_scores) / len(competitor_scores))
         
         # Aggregate recommendations
-        all_recommendations = []
-        all_recommendations.extend(title_result.recommendations)
-        all_recommendations.extend(desc_result.recommendations)
-        all_recommendations.extend(photos_result.recommendations)
-        all_recommendations.extend(pricing_result.recommendations)
-        all_recommendations.extend(amenities_result.recommendations)
-        all_recommendations.extend(reviews_result.recommendations)
+        all_recommendations = list(islice(chain(
+            title_result.recommendations,
+            desc_result.recommendations,
+            photos_result.recommendations,
+            pricing_result.recommendations,
+            amenities_result.recommendations,
+            reviews_result.recommendations,
+        ), 10))  # Top 10
         
         # Identify strengths (scores >= 80)
         strengths = []
@@ -278,7 +267,7 @@ class ListingGrader:
             pricing_score=pricing_result.score,
             amenities_score=amenities_result.score,
             reviews_score=reviews_result.score,
-            recommendations=all_recommendations[:10],  # Top 10
+            recommendations=all_recommendations,
             strengths=strengths,
             weaknesses=weaknesses,
             superhost_bonus=superhost_bonus,
@@ -288,8 +277,81 @@ class ListingGrader:
             competitors_analyzed=competitors_analyzed,
         )
     
-    def _quick_score(self, listing: ListingData) -> int:
-        """Quick score calculation for competitor comparison"""
+    def _score_content(self, listing: ListingData) -> Tuple[CategoryScore, ...]:
+        """Score the categories that don't depend on market data"""
+        features = extract_features(listing)
+        return (
+            score_title(listing, features=features),
+            score_description(listing, features=features),
+            score_photos(listing),
+            score_amenities(listing, features=features),
+            score_reviews(listing),
+        )
+    
+    async def _get_market(
+        self,
+        scraper: AirbnbScraper,
+        listing: ListingData,
+    ) -> Tuple[float, int, List[int]]:
+        """
+        Get market average price and competitor scores around a listing.
+        
+        Lookups are cached per ~0.05° location bucket, so listings in the
+        same area share one search and one competitor scoring pass, even
+        when graded concurrently.
+        """
+        key = (round(listing.latitude * 20), round(listing.longitude * 20))
+        return await self._market_cache.get(
+            key, lambda: self._fetch_market(scraper, listing)
+        )
+    
+    async def _fetch_market(
+        self,
+        scraper: AirbnbScraper,
+        listing: ListingData,
+    ) -> Tuple[float, int, List[int]]:
+        """Search competitors around a listing and score them (sorted)"""
+        market_avg = 0
+        competitors_analyzed = 0
+        competitor_scores = []
+        
+        competitors = await scraper.search_by_bounds(
+            ne_lat=listing.latitude + 0.05,
+            ne_lng=listing.longitude + 0.05,
+            sw_lat=listing.latitude - 0.05,
+            sw_lng=listing.longitude - 0.05,
+            max_listings=30,
+        )
+        
+        if competitors:
+            # Single pass over competitors for the average of priced ones
+            total, priced = 0.0, 0
+            for comp in competitors:
+                price = comp.price_per_night
+                if price > 0:
+                    total += price
+                    priced += 1
+            
+            if priced:
+                market_avg = total / priced
+                competitors_analyzed = len(competitors)
+                
+                # Calculate competitor scores for percentile
+                for comp in competitors:
+                    competitor_scores.append(self._quick_score(comp))
+                
+                # Sorted so each listing's percentile is a binary search
+                competitor_scores.sort()
+        
+        return market_avg, competitors_analyzed, competitor_scores
+    
+    def _quick_score(self, listing: Union[ListingData, ListingBasic]) -> int:
+        """
+        Quick score calculation for competitor comparison.
+        
+        Only reads images, rating, reviews_count and is_superhost, so search
+        results are scored directly without converting them to ListingData.
+        """
         score = 50
         
         # Photos
@@ -319,11 +381,15 @@ class ListingGrader:
         self,
         urls_or_ids: List[str],
         compare_market: bool = False,
-        max_concurrent: int = 3,
+        max_concurrent: int = 20,
     ) -> List[GradeResult]:
         """
         Grade multiple listings.
         
+        With compare_market, listings in the same ~0.05° area share one
+        competitor search, so a same-city batch costs one bounds query
+        per area rather than one per listing.
+        
         Args:
             urls_or_ids: List of Airbnb URLs or IDs
             compare_market: Enable market comparison
@@ -331,7 +397,12 @@ class ListingGrader:
         
         Returns:
             List of GradeResult objects
+        
+        Raises:
+            ValueError: If max_concurrent is below 1
         """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def grade_one(url_or_id: str) -> Optional[GradeResult]:
@@ -362,4 +433,18 @@ class ListingGrader:
         Returns:
             GradeResult with scores and recommendations
         """
-        return asyncio.run(self.grade(url_or_id, compare_market=compare_market))
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(
+            self.grade(url_or_id, compare_market=compare_market)
+        )
+    
+    def close_sync(self):
+        """Close the scraper and event loop used by grade_sync()"""
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self.close())
+        finally:
+            self._loop.close()
+            self._loop = None
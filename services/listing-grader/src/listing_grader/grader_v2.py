@@ -6,12 +6,14 @@ Uses scorer_v2 with 2025 ranking factors
 import asyncio
 import logging
 import re
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, AsyncIterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
 from airbnb_scraper import AirbnbScraper, ListingDetails
 
+from ._cache import FutureCache
+from ._compat import DATACLASS_SLOTS, dumps_json
 from .scorer_v2 import (
     ListingData,
     calculate_airbnb_score,
@@ -21,8 +23,26 @@ from .scorer_v2 import (
 
 logger = logging.getLogger(__name__)
 
+# Any URL that matches "airbnb.<tld>/rooms/<id>" also matches this
+_LISTING_ID_RE = re.compile(r'/rooms/(\d+)')
 
-@dataclass
+# How long host profiles and competitor searches are reused (seconds)
+_HOST_PROFILE_TTL = 3600
+_MARKET_TTL = 900
+
+# grade_stream() queue marker: a worker ran out of listings to grade
+_WORKER_DONE = object()
+
+# Algorithm weights as display strings, e.g. {"reviews": "25%", ...}
+_WEIGHT_STRS = {k: f"{int(v*100)}%" for k, v in ALGORITHM_WEIGHTS.items()}
+
+
+def _check_concurrency(max_concurrent: int) -> None:
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GradeResultV2:
     """Complete grading result - Airbnb Algorithm Aligned"""
     listing_id: str
@@ -84,14 +104,14 @@ class GradeResultV2:
             "overall_score": self.overall_score,
             "grade": self.grade,
             "category_scores": {
-                "reviews": {"score": self.reviews_score, "weight": "25%"},
-                "response": {"score": self.response_score, "weight": "15%"},
-                "pricing": {"score": self.pricing_score, "weight": "15%"},
-                "conversion": {"score": self.conversion_score, "weight": "12%"},
-                "instant_book": {"score": self.instant_book_score, "weight": "10%"},
-                "cancellation": {"score": self.cancellation_score, "weight": "8%"},
-                "listing_quality": {"score": self.listing_quality_score, "weight": "8%"},
-                "availability": {"score": self.availability_score, "weight": "7%"},
+                "reviews": {"score": self.reviews_score, "weight": _WEIGHT_STRS["reviews"]},
+                "response": {"score": self.response_score, "weight": _WEIGHT_STRS["response"]},
+                "pricing": {"score": self.pricing_score, "weight": _WEIGHT_STRS["pricing"]},
+                "conversion": {"score": self.conversion_score, "weight": _WEIGHT_STRS["conversion"]},
+                "instant_book": {"score": self.instant_book_score, "weight": _WEIGHT_STRS["instant_book"]},
+                "cancellation": {"score": self.cancellation_score, "weight": _WEIGHT_STRS["cancellation"]},
+                "listing_quality": {"score": self.listing_quality_score, "weight": _WEIGHT_STRS["listing_quality"]},
+                "availability": {"score": self.availability_score, "weight": _WEIGHT_STRS["availability"]},
             },
             "badges": {
                 "superhost": self.is_superhost,
@@ -119,6 +139,18 @@ class GradeResultV2:
             "graded_at": self.graded_at,
             "algorithm_version": self.algorithm_version,
         }
+    
+    def to_json(self) -> str:
+        """Convert to compact JSON (orjson-encoded when installed)"""
+        return dumps_json(self.to_dict())
+    
+    def copy(self) -> "GradeResultV2":
+        """Copy with its own recommendations list and category_weights dict"""
+        return replace(
+            self,
+            category_weights=dict(self.category_weights),
+            recommendations=list(self.recommendations),
+        )
 
 
 class ListingGraderV2:
@@ -150,6 +182,15 @@ class ListingGraderV2:
         self.currency = currency
         self.locale = locale
         self._scraper: Optional[AirbnbScraper] = None
+        # Host profiles per host_id, shared by concurrent grade() calls
+        self._host_cache = FutureCache(ttl=_HOST_PROFILE_TTL)
+        # Competitor searches per (lat cell, lng cell, radius), shared likewise
+        self._market_cache = FutureCache(ttl=_MARKET_TTL)
+        # Grading tasks in progress as [task, waiting callers], so duplicate
+        # listings are graded once
+        self._inflight: Dict[tuple, list] = {}
+        # Event loop reused by grade_sync() so the scraper session stays warm
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def _get_scraper(self) -> AirbnbScraper:
         """Get or create scraper instance"""
@@ -165,6 +206,8 @@ class ListingGraderV2:
         if self._scraper:
             await self._scraper.close()
             self._scraper = None
+        self._host_cache.clear()
+        self._market_cache.clear()
     
     async def __aenter__(self):
         return self
@@ -177,15 +220,9 @@ class ListingGraderV2:
         if url_or_id.isdigit():
             return url_or_id
         
-        patterns = [
-            r'/rooms/(\d+)',
-            r'airbnb\.[^/]+/rooms/(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url_or_id)
-            if match:
-                return match.group(1)
+        match = _LISTING_ID_RE.search(url_or_id)
+        if match:
+            return match.group(1)
         
         raise ValueError(f"Invalid Airbnb URL or ID: {url_or_id}")
     
@@ -292,9 +329,61 @@ class ListingGraderV2:
             checkout: Check-out date (YYYY-MM-DD)
         
         Returns:
-            GradeResultV2 with visibility score and recommendations
+            GradeResultV2 with visibility score and recommendations. Each
+            call gets its own copy, so callers sharing one grading run can
+            change their result without affecting the others.
+        
+        Raises:
+            ValueError: If the URL or ID is invalid, the listing cannot be
+                fetched, or market_radius_km is not positive
         """
+        # The market cache key divides by the radius
+        if market_radius_km <= 0:
+            raise ValueError(f"market_radius_km must be positive, got {market_radius_km}")
         listing_id = self._extract_listing_id(url_or_id)
+        
+        # Concurrent requests for the same listing share one grading task.
+        # It runs on its own, so a cancelled caller never cancels the others.
+        key = (listing_id, compare_market, market_radius_km, checkin, checkout)
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._grade_listing(
+                listing_id,
+                compare_market=compare_market,
+                market_radius_km=market_radius_km,
+                checkin=checkin,
+                checkout=checkout,
+            ))
+            entry = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._drop_inflight(key, entry))
+        
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return (await asyncio.shield(task)).copy()
+        except asyncio.CancelledError:
+            # Last caller gone - stop grading that nobody is waiting for
+            if entry[1] == 1 and not task.done():
+                self._drop_inflight(key, entry)
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+    
+    def _drop_inflight(self, key: tuple, entry: list) -> None:
+        """Forget an in-flight grading task, unless a newer one replaced it"""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+    
+    async def _grade_listing(
+        self,
+        listing_id: str,
+        compare_market: bool,
+        market_radius_km: float,
+        checkin: Optional[str],
+        checkout: Optional[str],
+    ) -> GradeResultV2:
+        """Fetch, score and assemble the result for one listing ID"""
         scraper = await self._get_scraper()
         
         # Fetch listing details
@@ -347,7 +436,7 @@ class ListingGraderV2:
             listing_quality_score=result["category_scores"]["listing_quality"]["score"],
             availability_score=result["category_scores"]["availability"]["score"],
             
-            category_weights={k: f"{int(v*100)}%" for k, v in ALGORITHM_WEIGHTS.items()},
+            category_weights=_WEIGHT_STRS.copy(),
             
             # Badges
             is_superhost=listing.is_superhost,
@@ -395,7 +484,7 @@ class ListingGraderV2:
         # If scraper has host profile method, use it
         if hasattr(scraper, 'get_host_profile'):
             try:
-                host = await scraper.get_host_profile(details.host_id)
+                host = await self._get_host_profile(scraper, details.host_id)
                 if host:
                     stats["response_rate"] = getattr(host, 'response_rate', 100)
                     stats["response_time_hours"] = getattr(host, 'response_time_hours', 1)
@@ -411,71 +500,162 @@ class ListingGraderV2:
         
         return stats
     
+    async def _get_host_profile(self, scraper: AirbnbScraper, host_id: str):
+        """
+        Get a host profile, fetched once per host.
+        
+        Property managers often have many listings in one batch; those
+        share a single profile request, even when graded concurrently.
+        """
+        return await self._host_cache.get(
+            host_id, lambda: scraper.get_host_profile(host_id)
+        )
+    
     async def _analyze_market(
         self,
         scraper: AirbnbScraper,
         listing: ListingData,
         radius_km: float,
     ) -> tuple:
-        """Analyze market for pricing comparison"""
+        """
+        Analyze market for pricing comparison.
+        
+        Competitor searches are cached per location cell (one radius wide),
+        so listings in the same area share one search, even when graded
+        concurrently. The average still excludes each listing itself.
+        """
         # Convert km to approximate lat/lng delta
         delta = radius_km / 111  # ~111km per degree
         
-        competitors = await scraper.search_by_bounds(
+        key = (round(listing.latitude / delta), round(listing.longitude / delta), radius_km)
+        competitors = await self._market_cache.get(key, lambda: scraper.search_by_bounds(
             ne_lat=listing.latitude + delta,
             ne_lng=listing.longitude + delta,
             sw_lat=listing.latitude - delta,
             sw_lng=listing.longitude - delta,
             max_listings=30,
-        )
+        ))
         
         if not competitors:
             return 0, 0
         
-        # Filter similar properties
-        similar = [
-            c for c in competitors
-            if c.price_per_night > 0
-            and c.airbnb_id != listing.listing_id
-        ]
+        # Average priced competitors (excluding this listing) in one pass
+        total, similar = 0.0, 0
+        for c in competitors:
+            price = c.price_per_night
+            if price > 0 and c.airbnb_id != listing.listing_id:
+                total += price
+                similar += 1
         
         if not similar:
             return 0, 0
         
-        prices = [c.price_per_night for c in similar]
-        market_avg = sum(prices) / len(prices)
-        
-        return market_avg, len(similar)
+        return total / similar, similar
+    
+    async def _grade_or_none(
+        self,
+        url_or_id: str,
+        compare_market: bool,
+    ) -> Optional[GradeResultV2]:
+        """grade() for batch use - failures are logged and return None"""
+        try:
+            return await self.grade(url_or_id, compare_market=compare_market)
+        except Exception as e:
+            logger.error(f"Failed to grade {url_or_id}: {e}")
+            return None
     
     async def grade_batch(
         self,
         urls_or_ids: List[str],
         compare_market: bool = False,
-        max_concurrent: int = 3,
+        max_concurrent: int = 20,
     ) -> List[GradeResultV2]:
-        """Grade multiple listings concurrently"""
-        semaphore = asyncio.Semaphore(max_concurrent)
+        """Grade multiple listings concurrently (results in input order)"""
+        _check_concurrency(max_concurrent)
+        results: List[Optional[GradeResultV2]] = [None] * len(urls_or_ids)
+        work = iter(enumerate(urls_or_ids))
         
-        async def grade_one(url_or_id: str) -> Optional[GradeResultV2]:
-            async with semaphore:
-                try:
-                    return await self.grade(url_or_id, compare_market=compare_market)
-                except Exception as e:
-                    logger.error(f"Failed to grade {url_or_id}: {e}")
-                    return None
+        async def worker():
+            # Workers share one iterator, so a batch of any size only
+            # ever has max_concurrent tasks alive
+            for i, url_or_id in work:
+                results[i] = await self._grade_or_none(url_or_id, compare_market)
         
-        tasks = [grade_one(u) for u in urls_or_ids]
-        results = await asyncio.gather(*tasks)
+        workers = min(max_concurrent, len(urls_or_ids))
+        await asyncio.gather(*(worker() for _ in range(workers)))
         
         return [r for r in results if r is not None]
     
+    async def grade_stream(
+        self,
+        urls_or_ids: List[str],
+        compare_market: bool = False,
+        max_concurrent: int = 20,
+    ) -> AsyncIterator[GradeResultV2]:
+        """
+        Grade multiple listings concurrently, yielding each result as soon
+        as it is ready (completion order, not input order).
+        
+        Example:
+            async for result in grader.grade_stream(urls):
+                print(result.overall_score)
+        """
+        _check_concurrency(max_concurrent)
+        
+        # Results (None for a failed listing), then one _WORKER_DONE or the
+        # exception that stopped it from each worker
+        done: asyncio.Queue = asyncio.Queue()
+        work = iter(urls_or_ids)
+        
+        async def worker():
+            try:
+                for url_or_id in work:
+                    done.put_nowait(await self._grade_or_none(url_or_id, compare_market))
+            except BaseException as e:
+                done.put_nowait(e)
+            else:
+                done.put_nowait(_WORKER_DONE)
+        
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(max_concurrent, len(urls_or_ids)))
+        ]
+        try:
+            running = len(workers)
+            while running:
+                item = await done.get()
+                if item is _WORKER_DONE:
+                    running -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                elif item is not None:
+                    yield item
+        finally:
+            # Consumer stopped early - don't leave grading in the background
+            for task in workers:
+                task.cancel()
+    
     def grade_sync(
         self,
         url_or_id: str,
         compare_market: bool = False,
     ) -> GradeResultV2:
         """Synchronous wrapper for grade()"""
-        return asyncio.run(self.grade(url_or_id, compare_market=compare_market))
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(
+            self.grade(url_or_id, compare_market=compare_market)
+        )
+    
+    def close_sync(self):
+        """Close the scraper and event loop used by grade_sync()"""
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self.close())
+        finally:
+            self._loop.close()
+            self._loop = None
 
 
 # Alias for backward compatibility
@@ -6,8 +6,10 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+from ._compat import DATACLASS_SLOTS, dumps_json
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ListingData:
     """Raw listing data from Airbnb"""
     listing_id: str
@@ -57,7 +59,7 @@ class ListingData:
     scraped_at: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CategoryScore:
     """Score for a single category"""
     score: int  # 0-100
@@ -66,7 +68,7 @@ class CategoryScore:
     recommendations: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GradeResult:
     """Complete grading result"""
     listing_id: str
@@ -132,6 +134,10 @@ class GradeResult:
             } if self.competitor_avg_score else None,
             "graded_at": self.graded_at,
         }
+    
+    def to_json(self) -> str:
+        """Convert to compact JSON (orjson-encoded when installed)"""
+        return dumps_json(self.to_dict())
 
 
 # Score thresholds for grades
@@ -152,9 +158,19 @@ GRADE_THRESHOLDS = {
 }
 
 
-def score_to_grade(score: int) -> str:
-    """Convert numeric score to letter grade"""
+def _grade_for(score: int) -> str:
     for threshold, grade in sorted(GRADE_THRESHOLDS.items(), reverse=True):
         if score >= threshold:
             return grade
     return "F"
+
+
+# Letter grade for every score 0-100; anything above 100 grades like 100
+_GRADE_LUT = tuple(_grade_for(s) for s in range(101))
+
+
+def score_to_grade(score: int) -> str:
+    """Convert numeric score to letter grade"""
+    if score < 0:
+        return "F"
+    return _GRADE_LUT[min(int(score), 100)]
@@ -3,7 +3,10 @@ Scoring algorithms for each listing category
 """
 
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Tuple, FrozenSet, Optional
+from ._compat import DATACLASS_SLOTS
 from .models import ListingData, CategoryScore
 
 
@@ -33,12 +36,84 @@ TITLE_KEYWORDS = [
     "downtown", "historic", "garden", "terrace", "pool",
 ]
 
+# Topics a good description covers
+DESCRIPTION_TOPICS = {
+    "neighborhood": ["neighborhood", "area", "district", "located", "walk to", "minutes from"],
+    "transport": ["metro", "subway", "bus", "station", "airport", "parking", "train"],
+    "amenities": ["kitchen", "wifi", "bed", "bathroom", "towels", "equipped"],
+    "rules": ["check-in", "checkout", "no smoking", "quiet", "please", "note"],
+}
+
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001F9FF]')
+
+# Titles that say nothing beyond the property type
+_GENERIC_TITLES = frozenset({"apartment", "room", "house", "flat", "studio"})
+
+
+# ============================================
+# FEATURE EXTRACTION
+# ============================================
+
+@dataclass(**DATACLASS_SLOTS)
+class ListingFeatures:
+    """Normalized listing text shared by the scorers, computed once"""
+    title_lower: str
+    city_lower: str
+    neighborhood_lower: str
+    amenities_lower: List[str]
+    amenities_text: str  # amenities_lower joined by newlines, for keyword scans
+    desc_topics: FrozenSet[str]  # DESCRIPTION_TOPICS keys covered
+
+
+def extract_features(listing: ListingData) -> ListingFeatures:
+    """
+    Lowercase and scan the listing text once for all scorers.
+    
+    Pass the result as `features=` to score_title, score_description and
+    score_amenities to avoid repeating this work in each of them.
+    """
+    amenities_lower = [a.lower() for a in listing.amenities]
+    return ListingFeatures(
+        title_lower=listing.name.lower(),
+        city_lower=(listing.city or "").lower(),
+        neighborhood_lower=(listing.neighborhood or "").lower(),
+        amenities_lower=amenities_lower,
+        amenities_text="\n".join(amenities_lower),
+        desc_topics=_desc_topics(listing.description),
+    )
+
+
+def _desc_topics(description: str) -> FrozenSet[str]:
+    """DESCRIPTION_TOPICS keys with a keyword in the description"""
+    desc_lower = description.lower()
+    return frozenset(
+        topic for topic, keywords in DESCRIPTION_TOPICS.items()
+        if any(kw in desc_lower for kw in keywords)
+    )
+
 
 # ============================================
 # TITLE SCORING (15%)
 # ============================================
 
-def score_title(listing: ListingData) -> CategoryScore:
+# Title length buckets: lengths from each start up to the next one share a
+# (score delta, recommendation) rule; "{length}" is filled in
+_TITLE_LENGTH_STARTS = (0, 20, 30, 40, 61, 81, 101)
+_TITLE_LENGTH_RULES = (
+    (-20, "Title too short ({length} chars). Aim for 40-60 characters."),
+    (0, None),   # 20-29
+    (10, None),  # 30-39 acceptable
+    (20, None),  # 40-60 perfect length
+    (10, None),  # 61-80 acceptable
+    (0, None),   # 81-100
+    (-15, "Title too long ({length} chars). Keep under 80 characters."),
+)
+
+
+def score_title(
+    listing: ListingData,
+    features: Optional[ListingFeatures] = None,
+) -> CategoryScore:
     """
     Score the listing title.
     
@@ -52,19 +127,22 @@ def score_title(listing: ListingData) -> CategoryScore:
     
     # Length scoring
     length = len(title)
-    if 40 <= length <= 60:
-        score += 20  # Perfect length
-    elif 30 <= length < 40 or 60 < length <= 80:
-        score += 10  # Acceptable
-    elif length < 20:
-        score -= 20
-        recommendations.append(f"Title too short ({length} chars). Aim for 40-60 characters.")
-    elif length > 100:
-        score -= 15
-        recommendations.append(f"Title too long ({length} chars). Keep under 80 characters.")
+    delta, advice = _TITLE_LENGTH_RULES[bisect_right(_TITLE_LENGTH_STARTS, length) - 1]
+    score += delta
+    if advice:
+        recommendations.append(advice.format(length=length))
+    
+    # Standalone calls lowercase only the fields this scorer reads
+    if features is None:
+        title_lower = listing.name.lower()
+        city_lower = (listing.city or "").lower()
+        neighborhood_lower = (listing.neighborhood or "").lower()
+    else:
+        title_lower = features.title_lower
+        city_lower = features.city_lower
+        neighborhood_lower = features.neighborhood_lower
     
     # Keyword analysis
-    title_lower = title.lower()
     keywords_found = sum(1 for kw in TITLE_KEYWORDS if kw in title_lower)
     if keywords_found >= 3:
         score += 15
@@ -76,23 +154,22 @@ def score_title(listing: ListingData) -> CategoryScore:
         recommendations.append("Add descriptive keywords (cozy, modern, central, etc.)")
     
     # Location mention
-    if listing.city and listing.city.lower() in title_lower:
+    if listing.city and city_lower in title_lower:
         score += 5
-    elif listing.neighborhood and listing.neighborhood.lower() in title_lower:
+    elif listing.neighborhood and neighborhood_lower in title_lower:
         score += 5
     else:
         recommendations.append(f"Consider adding location ({listing.city or 'your area'}) to title")
     
     # Penalties
     # ALL CAPS check
-    caps_ratio = sum(1 for c in title if c.isupper()) / max(len(title), 1)
+    caps_ratio = sum(map(str.isupper, title)) / max(length, 1)
     if caps_ratio > 0.5:
         score -= 15
         recommendations.append("Avoid ALL CAPS - it looks spammy")
     
     # Emoji check
-    emoji_pattern = re.compile(r'[\U0001F300-\U0001F9FF]')
-    emoji_count = len(emoji_pattern.findall(title))
+    emoji_count = len(_EMOJI_RE.findall(title))
     if emoji_count > 3:
         score -= 10
         recommendations.append("Too many emojis. Use 1-2 max.")
@@ -100,8 +177,7 @@ def score_title(listing: ListingData) -> CategoryScore:
         pass  # Neutral
     
     # Generic title penalty
-    generic_titles = ["apartment", "room", "house", "flat", "studio"]
-    if title_lower.strip() in generic_titles:
+    if title_lower.strip() in _GENERIC_TITLES:
         score -= 20
         recommendations.append("Title too generic. Add unique features.")
     
@@ -117,7 +193,23 @@ def score_title(listing: ListingData) -> CategoryScore:
 # DESCRIPTION SCORING (15%)
 # ============================================
 
-def score_description(listing: ListingData) -> CategoryScore:
+# Description length buckets, same layout as the title ones
+_DESC_LENGTH_STARTS = (0, 300, 500, 800, 1501, 2001, 3001)
+_DESC_LENGTH_RULES = (
+    (-20, "Description too short ({length} chars). Add more details."),
+    (5, "Description could be longer (aim for 800-1500 chars)"),
+    (15, None),  # 500-799
+    (25, None),  # 800-1500 optimal
+    (15, None),  # 1501-2000
+    (0, None),   # 2001-3000
+    (-10, "Description very long. Consider being more concise."),
+)
+
+
+def score_description(
+    listing: ListingData,
+    features: Optional[ListingFeatures] = None,
+) -> CategoryScore:
     """
     Score the listing description.
     
@@ -130,34 +222,18 @@ def score_description(listing: ListingData) -> CategoryScore:
     
     # Length scoring
     length = len(desc)
-    if 800 <= length <= 1500:
-        score += 25
-    elif 500 <= length < 800 or 1500 < length <= 2000:
-        score += 15
-    elif 300 <= length < 500:
-        score += 5
-        recommendations.append("Description could be longer (aim for 800-1500 chars)")
-    elif length < 300:
-        score -= 20
-        recommendations.append(f"Description too short ({length} chars). Add more details.")
-    elif length > 3000:
-        score -= 10
-        recommendations.append("Description very long. Consider being more concise.")
+    delta, advice = _DESC_LENGTH_RULES[bisect_right(_DESC_LENGTH_STARTS, length) - 1]
+    score += delta
+    if advice:
+        recommendations.append(advice.format(length=length))
     
-    desc_lower = desc.lower()
+    if features is None:
+        desc_topics = _desc_topics(desc)
+    else:
+        desc_topics = features.desc_topics
     
     # Section/topic coverage
-    topics = {
-        "neighborhood": ["neighborhood", "area", "district", "located", "walk to", "minutes from"],
-        "transport": ["metro", "subway", "bus", "station", "airport", "parking", "train"],
-        "amenities": ["kitchen", "wifi", "bed", "bathroom", "towels", "equipped"],
-        "rules": ["check-in", "checkout", "no smoking", "quiet", "please", "note"],
-    }
-    
-    topics_covered = 0
-    for topic, keywords in topics.items():
-        if any(kw in desc_lower for kw in keywords):
-            topics_covered += 1
+    topics_covered = len(desc_topics)
     
     if topics_covered >= 4:
         score += 15
@@ -166,14 +242,11 @@ def score_description(listing: ListingData) -> CategoryScore:
     elif topics_covered >= 2:
         score += 5
     else:
-        missing = []
-        for topic, keywords in topics.items():
-            if not any(kw in desc_lower for kw in keywords):
-                missing.append(topic)
+        missing = [t for t in DESCRIPTION_TOPICS if t not in desc_topics]
         recommendations.append(f"Add info about: {', '.join(missing)}")
     
     # Formatting check (paragraphs)
-    paragraphs = len([p for p in desc.split('\n\n') if p.strip()])
+    paragraphs = sum(1 for p in desc.split('\n\n') if p and not p.isspace())
     if paragraphs >= 3:
         score += 5
     elif paragraphs == 1 and length > 500:
@@ -201,6 +274,18 @@ def score_photos(listing: ListingData) -> CategoryScore:
     """
     photos = listing.images
     count = len(photos)
+    
+    if count == 0:
+        return CategoryScore(
+            score=0,
+            weight=0.20,
+            details="Photo count: 0",
+            recommendations=[
+                "Too few photos (0). Add at least 10 more.",
+                "CRITICAL: No photos! Add at least 10 quality photos.",
+            ],
+        )
+    
     score = 50
     recommendations = []
     
@@ -223,20 +308,13 @@ def score_photos(listing: ListingData) -> CategoryScore:
         recommendations.append("Consider removing duplicate/low-quality photos")
     
     # Quality indicators (heuristics based on URL patterns)
-    if photos:
-        # Check for high-res indicators
-        high_res = sum(1 for p in photos if "large" in p.lower() or "xl" in p.lower() or "1200" in p)
-        if high_res > count * 0.5:
-            score += 10
+    # Check for high-res indicators
+    high_res = sum(1 for p in photos if "large" in p.lower() or "xl" in p.lower() or "1200" in p)
+    if high_res > count * 0.5:
+        score += 10
     
     # First photo bonus (it's the cover)
-    if photos:
-        score += 5  # Has at least one photo
-    
-    # Recommendations based on count
-    if count == 0:
-        recommendations.append("CRITICAL: No photos! Add at least 10 quality photos.")
-        score = 0
+    score += 5  # Has at least one photo
     
     return CategoryScore(
         score=max(0, min(100, score)),
@@ -312,7 +390,10 @@ def score_pricing(
 # AMENITIES SCORING (15%)
 # ============================================
 
-def score_amenities(listing: ListingData) -> CategoryScore:
+def score_amenities(
+    listing: ListingData,
+    features: Optional[ListingFeatures] = None,
+) -> CategoryScore:
     """
     Score amenities coverage.
     
@@ -320,7 +401,13 @@ def score_amenities(listing: ListingData) -> CategoryScore:
     Premium: Pool, Hot tub, Workspace, etc.
     Safety: Smoke detector, First aid, etc.
     """
-    amenities = [a.lower() for a in listing.amenities]
+    if features is None:
+        amenities = [a.lower() for a in listing.amenities]
+        amenities_text = "\n".join(amenities)
+    else:
+        amenities = features.amenities_lower
+        amenities_text = features.amenities_text
+    # A keyword is in some amenity iff it is in the newline-joined text
     score = 30  # Base
     recommendations = []
     
@@ -328,7 +415,7 @@ def score_amenities(listing: ListingData) -> CategoryScore:
     essential_found = []
     essential_missing = []
     for amenity in ESSENTIAL_AMENITIES:
-        if any(amenity in a for a in amenities):
+        if amenity in amenities_text:
             essential_found.append(amenity)
             score += 4
         else:
@@ -337,7 +424,7 @@ def score_amenities(listing: ListingData) -> CategoryScore:
     # Premium amenities (bonus points)
     premium_found = []
     for amenity in PREMIUM_AMENITIES:
-        if any(amenity in a for a in amenities):
+        if amenity in amenities_text:
             premium_found.append(amenity)
             score += 3
     
@@ -345,7 +432,7 @@ def score_amenities(listing: ListingData) -> CategoryScore:
     safety_found = []
     safety_missing = []
     for amenity in SAFETY_AMENITIES:
-        if any(amenity in a for a in amenities):
+        if amenity in amenities_text:
             safety_found.append(amenity)
             score += 2
         else:
@@ -17,9 +17,12 @@ Guest Favorites Sub-Categories (each weighted equally):
 """
 
 import re
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
 
+from ._compat import DATACLASS_SLOTS
+
 
 # ============================================
 # AIRBNB ALGORITHM WEIGHTS (2025)
@@ -67,7 +70,7 @@ TITLE_KEYWORDS = [
 # DATA MODELS
 # ============================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListingData:
     """Listing data for scoring"""
     listing_id: str
@@ -149,7 +152,7 @@ class ListingData:
     scraped_at: str = ""
 
 
-@dataclass 
+@dataclass(**DATACLASS_SLOTS)
 class CategoryScore:
     """Score for a single category"""
     score: int
@@ -163,6 +166,38 @@ class CategoryScore:
 # 1. REVIEWS SCORING (25%)
 # ============================================
 
+# Threshold tables: value >= STARTS[i-1] (and below STARTS[i]) scores
+# RULES[i] = (points, recommendation or None); RULES[0] is below every start
+_RATING_STARTS = (4.0, 4.5, 4.7, 4.8, 4.85, 4.9, 4.95)
+_RATING_RULES = (
+    (5, "🔴 EMERGENCY: Low rating is killing your visibility"),  # rated, < 4.0
+    (10, "🔴 URGENT: Rating below 4.5 severely limits search ranking"),
+    (20, "🔴 CRITICAL: Rating below 4.8 hurts visibility significantly"),
+    (28, None),
+    (32, None),
+    (35, None),
+    (38, None),
+    (40, None),
+)
+
+_REVIEW_COUNT_STARTS = (1, 3, 5, 10, 20, 50, 100)
+_REVIEW_COUNT_RULES = (
+    (0, "🔴 No reviews = invisible in search. Priority #1!"),
+    (2, "Focus on getting your first 5 reviews - offer discounts"),
+    (5, "Need at least 5 reviews for Guest Favorites eligibility"),
+    (10, "Aim for 10+ reviews for better ranking"),
+    (15, None),
+    (20, None),
+    (25, None),
+    (30, None),
+)
+
+# Sub-ratings (and the overall rating when none are published) band at
+# 4.5 / 4.8 / 4.9; band 0 is rated but below 4.5
+_SUB_RATING_STARTS = (4.5, 4.8, 4.9)
+_SUB_RATING_POINTS = (1, 3, 4, 5)
+_SUB_RATING_FALLBACK_POINTS = (10, 15, 20, 25)
+
 def score_reviews(listing: ListingData) -> CategoryScore:
     """Score reviews - THE MOST IMPORTANT FACTOR"""
     score = 0
@@ -173,83 +208,42 @@ def score_reviews(listing: ListingData) -> CategoryScore:
     count = listing.reviews_count
     
     # Overall Rating (40 points)
-    if rating >= 4.95:
-        score += 40
-    elif rating >= 4.9:
-        score += 38
-    elif rating >= 4.85:
-        score += 35
-    elif rating >= 4.8:
-        score += 32
-    elif rating >= 4.7:
-        score += 28
-    elif rating >= 4.5:
-        score += 20
-        recommendations.append("🔴 CRITICAL: Rating below 4.8 hurts visibility significantly")
-    elif rating >= 4.0:
-        score += 10
-        recommendations.append("🔴 URGENT: Rating below 4.5 severely limits search ranking")
-    elif rating > 0:
-        score += 5
-        recommendations.append("🔴 EMERGENCY: Low rating is killing your visibility")
+    if rating > 0:
+        points, advice = _RATING_RULES[bisect_right(_RATING_STARTS, rating)]
     else:
-        recommendations.append("No reviews yet - focus on getting first 5 reviews ASAP")
+        points, advice = 0, "No reviews yet - focus on getting first 5 reviews ASAP"
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     # Review Count (30 points)
-    if count >= 100:
-        score += 30
-    elif count >= 50:
-        score += 25
-    elif count >= 20:
-        score += 20
-    elif count >= 10:
-        score += 15
-    elif count >= 5:
-        score += 10
-        recommendations.append("Aim for 10+ reviews for better ranking")
-    elif count >= 3:
-        score += 5
-        recommendations.append("Need at least 5 reviews for Guest Favorites eligibility")
-    elif count > 0:
-        score += 2
-        recommendations.append("Focus on getting your first 5 reviews - offer discounts")
-    else:
-        recommendations.append("🔴 No reviews = invisible in search. Priority #1!")
-    
-    # Sub-category ratings (30 points)
-    sub_scores = []
-    sub_categories = [
-        ("cleanliness", listing.rating_cleanliness, "Cleanliness"),
-        ("accuracy", listing.rating_accuracy, "Accuracy"),
-        ("checkin", listing.rating_checkin, "Check-in"),
-        ("communication", listing.rating_communication, "Communication"),
-        ("location", listing.rating_location, "Location"),
-        ("value", listing.rating_value, "Value"),
-    ]
-    
-    for key, sub_rating, name in sub_categories:
-        if sub_rating >= 4.9:
-            sub_scores.append(5)
-        elif sub_rating >= 4.8:
-            sub_scores.append(4)
-        elif sub_rating >= 4.5:
-            sub_scores.append(3)
-        elif sub_rating > 0:
-            sub_scores.append(1)
-            if sub_rating < 4.5:
+    points, advice = _REVIEW_COUNT_RULES[bisect_right(_REVIEW_COUNT_STARTS, count)]
+    score += points
+    if advice:
+        recommendations.append(advice)
+    
+    # Sub-category ratings (30 points); unrated (0) categories are skipped
+    sub_ratings = (
+        ("Cleanliness", listing.rating_cleanliness),
+        ("Accuracy", listing.rating_accuracy),
+        ("Check-in", listing.rating_checkin),
+        ("Communication", listing.rating_communication),
+        ("Location", listing.rating_location),
+        ("Value", listing.rating_value),
+    )
+    
+    rated = False
+    for name, sub_rating in sub_ratings:
+        if sub_rating > 0:
+            rated = True
+            band = bisect_right(_SUB_RATING_STARTS, sub_rating)
+            score += _SUB_RATING_POINTS[band]
+            if band == 0:
                 recommendations.append(f"Improve {name} rating ({sub_rating}) - impacts ranking")
     
-    if sub_scores:
-        score += sum(sub_scores)
-    else:
-        if rating >= 4.9:
-            score += 25
-        elif rating >= 4.8:
-            score += 20
-        elif rating >= 4.5:
-            score += 15
-        elif rating > 0:
-            score += 10
+    # No sub-ratings published: estimate from the overall rating
+    if not rated and rating > 0:
+        score += _SUB_RATING_FALLBACK_POINTS[bisect_right(_SUB_RATING_STARTS, rating)]
     
     # Guest Favorites status
     if listing.is_guest_favorite:
@@ -283,6 +277,37 @@ def score_reviews(listing: ListingData) -> CategoryScore:
 # 2. RESPONSE RATE & TIME (15%)
 # ============================================
 
+_RESPONSE_RATE_STARTS = (70, 80, 90, 95, 98)
+_RESPONSE_RATE_RULES = (
+    (0, "🔴 CRITICAL: Low response rate severely impacts visibility"),
+    (10, "🔴 Response rate below 80% - significantly hurts ranking"),
+    (20, "🟡 Response rate below 90% - hurts Superhost status"),
+    (30, None),
+    (35, None),
+    (40, None),
+)
+
+# Response time is better when lower: hours <= LIMITS[i] scores RULES[i]
+_RESPONSE_TIME_LIMITS = (0.5, 1, 2, 6, 12, 24)
+_RESPONSE_TIME_RULES = (
+    (40, None),
+    (35, None),
+    (30, None),
+    (20, None),
+    (10, "🟡 Respond within 1 hour for best ranking"),
+    (5, "🔴 Response time over 12h hurts ranking"),
+    (0, "🔴 CRITICAL: Response time over 24h tanks your visibility"),
+)
+
+_ACCEPTANCE_RATE_STARTS = (70, 80, 90, 95)
+_ACCEPTANCE_RATE_RULES = (
+    (0, "Low acceptance rate may hurt ranking"),
+    (0, None),
+    (5, None),
+    (8, None),
+    (10, None),
+)
+
 def score_response(listing: ListingData) -> CategoryScore:
     """Score response metrics"""
     score = 50
@@ -294,48 +319,22 @@ def score_response(listing: ListingData) -> CategoryScore:
     acceptance_rate = listing.acceptance_rate
     
     # Response Rate (40 points)
-    if response_rate >= 98:
-        score += 40
-    elif response_rate >= 95:
-        score += 35
-    elif response_rate >= 90:
-        score += 30
-    elif response_rate >= 80:
-        score += 20
-        recommendations.append("🟡 Response rate below 90% - hurts Superhost status")
-    elif response_rate >= 70:
-        score += 10
-        recommendations.append("🔴 Response rate below 80% - significantly hurts ranking")
-    else:
-        recommendations.append("🔴 CRITICAL: Low response rate severely impacts visibility")
+    points, advice = _RESPONSE_RATE_RULES[bisect_right(_RESPONSE_RATE_STARTS, response_rate)]
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     # Response Time (40 points)
-    if response_time <= 0.5:
-        score += 40
-    elif response_time <= 1:
-        score += 35
-    elif response_time <= 2:
-        score += 30
-    elif response_time <= 6:
-        score += 20
-    elif response_time <= 12:
-        score += 10
-        recommendations.append("🟡 Respond within 1 hour for best ranking")
-    elif response_time <= 24:
-        score += 5
-        recommendations.append("🔴 Response time over 12h hurts ranking")
-    else:
-        recommendations.append("🔴 CRITICAL: Response time over 24h tanks your visibility")
+    points, advice = _RESPONSE_TIME_RULES[bisect_left(_RESPONSE_TIME_LIMITS, response_time)]
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     # Acceptance Rate (20 points)
-    if acceptance_rate >= 95:
-        score += 10
-    elif acceptance_rate >= 90:
-        score += 8
-    elif acceptance_rate >= 80:
-        score += 5
-    elif acceptance_rate < 70:
-        recommendations.append("Low acceptance rate may hurt ranking")
+    points, advice = _ACCEPTANCE_RATE_RULES[bisect_right(_ACCEPTANCE_RATE_STARTS, acceptance_rate)]
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     return CategoryScore(
         score=min(100, score),
@@ -603,8 +602,9 @@ def score_listing_quality(listing: ListingData) -> CategoryScore:
         recommendations.append("Add info about: neighborhood, transport, amenities, house rules")
     
     # Amenities (35 points)
-    amenities = [a.lower() for a in listing.amenities]
-    amenity_count = len(amenities)
+    # A keyword is in some amenity iff it is in the newline-joined text
+    amenities = "\n".join(listing.amenities).lower()
+    amenity_count = len(listing.amenities)
     
     if amenity_count >= 20:
         score += 25
@@ -620,14 +620,14 @@ def score_listing_quality(listing: ListingData) -> CategoryScore:
         recommendations.append("🔴 Add more amenities (8-9 minimum for ranking)")
     
     # Essential amenities
-    essential_found = sum(1 for a in ESSENTIAL_AMENITIES if any(a in am for am in amenities))
+    essential_found = sum(1 for a in ESSENTIAL_AMENITIES if a in amenities)
     if essential_found < 5:
-        missing = [a for a in ESSENTIAL_AMENITIES[:6] if not any(a in am for am in amenities)]
+        missing = [a for a in ESSENTIAL_AMENITIES[:6] if a not in amenities]
         if missing:
             recommendations.append(f"Add essential amenities: {', '.join(missing[:3])}")
     
     # Safety
-    safety_found = sum(1 for a in SAFETY_AMENITIES if any(a in am for am in amenities))
+    safety_found = sum(1 for a in SAFETY_AMENITIES if a in amenities)
     if safety_found < 2:
         recommendations.append("Add safety amenities (smoke detector, CO detector)")
     
@@ -644,6 +644,28 @@ def score_listing_quality(listing: ListingData) -> CategoryScore:
 # 8. CALENDAR AVAILABILITY (7%)
 # ============================================
 
+_AVAIL_30_STARTS = (7, 15, 25)
+_AVAIL_30_RULES = (
+    (0, "Open more dates in the next 30 days"),
+    (5, None),
+    (10, None),
+    (15, None),
+)
+
+_AVAIL_90_STARTS = (30, 60)
+_AVAIL_90_POINTS = (0, 10, 15)
+
+# 1 night is best; anything up to 3 (including unset <= 0) scores 5
+_MIN_NIGHTS_STARTS = (1, 2, 3, 4, 8)
+_MIN_NIGHTS_RULES = (
+    (5, None),
+    (10, None),
+    (8, None),
+    (5, None),
+    (0, None),
+    (0, "🟡 High minimum nights limits search visibility"),
+)
+
 def score_availability(listing: ListingData) -> CategoryScore:
     """Score calendar availability"""
     score = 50
@@ -657,30 +679,19 @@ def score_availability(listing: ListingData) -> CategoryScore:
         recommendations.append("🔴 Update your calendar - stale calendars hurt ranking")
     
     avail_30 = listing.availability_days_30
-    if avail_30 >= 25:
-        score += 15
-    elif avail_30 >= 15:
-        score += 10
-    elif avail_30 >= 7:
-        score += 5
-    else:
-        recommendations.append("Open more dates in the next 30 days")
+    points, advice = _AVAIL_30_RULES[bisect_right(_AVAIL_30_STARTS, avail_30)]
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     avail_90 = listing.availability_days_90
-    if avail_90 >= 60:
-        score += 15
-    elif avail_90 >= 30:
-        score += 10
+    score += _AVAIL_90_POINTS[bisect_right(_AVAIL_90_STARTS, avail_90)]
     
     min_nights = listing.min_nights
-    if min_nights == 1:
-        score += 10
-    elif min_nights == 2:
-        score += 8
-    elif min_nights <= 3:
-        score += 5
-    elif min_nights > 7:
-        recommendations.append("🟡 High minimum nights limits search visibility")
+    points, advice = _MIN_NIGHTS_RULES[bisect_right(_MIN_NIGHTS_STARTS, min_nights)]
+    score += points
+    if advice:
+        recommendations.append(advice)
     
     return CategoryScore(
         score=min(100, score),
@@ -695,6 +706,12 @@ def score_availability(listing: ListingData) -> CategoryScore:
 # AGGREGATE SCORING
 # ============================================
 
+# Recommendation order; unknown priorities sort last
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Guest Favorites bonus by percentile (top 1% / top 5%); other badges get 8
+_GF_PERCENTILE_BONUS = {1: 12, 5: 10}
+
 def calculate_airbnb_score(listing: ListingData, market_avg: float = 0) -> dict:
     """Calculate overall Airbnb-aligned score"""
     
@@ -720,23 +737,27 @@ def calculate_airbnb_score(listing: ListingData, market_avg: float = 0) -> dict:
     
     superhost_bonus = 5 if listing.is_superhost else 0
     
-    gf_bonus = 0
-    if listing.is_guest_favorite:
-        gf_bonus = 8
-        if listing.guest_favorite_percentile == 1:
-            gf_bonus = 12
-        elif listing.guest_favorite_percentile == 5:
-            gf_bonus = 10
+    gf_bonus = (
+        _GF_PERCENTILE_BONUS.get(listing.guest_favorite_percentile, 8)
+        if listing.is_guest_favorite else 0
+    )
     
     total_score = min(100, int(weighted_score + superhost_bonus + gf_bonus))
     
-    all_recs = []
-    for cat in [reviews, response, pricing, conversion, instant, cancellation, quality, availability]:
-        for rec in cat.recommendations:
-            all_recs.append((cat.priority, rec))
-    
-    priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    all_recs.sort(key=lambda x: priority_order.get(x[0], 4))
+    # Bucketing by priority in category order gives the same ordering as a
+    # stable sort on priority, without a key call per recommendation
+    buckets = ([], [], [], [], [])
+    for cat in (reviews, response, pricing, conversion, instant, cancellation, quality, availability):
+        if cat.recommendations:
+            buckets[_PRIORITY_ORDER.get(cat.priority, 4)].extend(cat.recommendations)
+    
+    # Only the top 10 are returned; lower tiers are skipped once it is full
+    top_recs = []
+    for bucket in buckets:
+        top_recs.extend(bucket)
+        if len(top_recs) >= 10:
+            del top_recs[10:]
+            break
     
     return {
         "overall_score": total_score,
@@ -755,23 +776,21 @@ def calculate_airbnb_score(listing: ListingData, market_avg: float = 0) -> dict:
             "superhost": superhost_bonus,
             "guest_favorites": gf_bonus,
         },
-        "recommendations": [rec for _, rec in all_recs[:10]],
+        "recommendations": top_recs,
         "guest_favorites_eligible": listing.rating >= 4.9 and listing.reviews_count >= 5 and listing.cancellation_rate < 1,
     }
 
 
+# Lowest score for each grade above F
+_GRADE_THRESHOLDS = (40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95)
+_GRADES = ("F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+# Letter grade for every score 0-100; anything above 100 grades like 100
+_GRADE_LUT = tuple(_GRADES[bisect_right(_GRADE_THRESHOLDS, s)] for s in range(101))
+
+
 def score_to_grade(score: int) -> str:
     """Convert score to letter grade"""
-    if score >= 95: return "A+"
-    if score >= 90: return "A"
-    if score >= 85: return "A-"
-    if score >= 80: return "B+"
-    if score >= 75: return "B"
-    if score >= 70: return "B-"
-    if score >= 65: return "C+"
-    if score >= 60: return "C"
-    if score >= 55: return "C-"
-    if score >= 50: return "D+"
-    if score >= 45: return "D"
-    if score >= 40: return "D-"
-    return "F"
+    if score < 0:
+        return "F"
+    return _GRADE_LUT[min(int(score), 100)]
@@ -0,0 +1,115 @@
+"""
+Tests for the shared async lookup cache
+"""
+
+import asyncio
+import gc
+
+import pytest
+from listing_grader import _cache
+from listing_grader._cache import FutureCache
+
+
+class Lookup:
+    """Counts calls; fails while `error` is set"""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+        self.gate = None
+
+    async def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+async def until(condition):
+    """Let other tasks run until condition() holds"""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never became true")
+
+
+class TestFutureCache:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_lookup(self):
+        cache, lookup = FutureCache(ttl=60), Lookup()
+        results = await asyncio.gather(*(cache.get("k", lookup) for _ in range(3)))
+
+        assert results == [1, 1, 1]
+        assert await cache.get("k", lookup) == 1
+        assert lookup.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_retried(self):
+        cache, lookup = FutureCache(ttl=60), Lookup()
+        lookup.error = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            await cache.get("k", lookup)
+
+        lookup.error = None
+        assert await cache.get("k", lookup) == 2
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_lookup(self):
+        cache, lookup = FutureCache(ttl=60), Lookup()
+        lookup.gate = asyncio.Event()
+        first = asyncio.ensure_future(cache.get("k", lookup))
+        second = asyncio.ensure_future(cache.get("k", lookup))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        lookup.gate.set()
+
+        assert await second == 1
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_results_expire_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(_cache, "monotonic", lambda: now[0])
+        cache, lookup = FutureCache(ttl=60), Lookup()
+
+        assert await cache.get("k", lookup) == 1
+        now[0] += 59
+        assert await cache.get("k", lookup) == 1
+        now[0] += 1
+        assert await cache.get("k", lookup) == 2
+
+    @pytest.mark.asyncio
+    async def test_oldest_keys_dropped_beyond_maxsize(self):
+        cache, lookup = FutureCache(ttl=60, maxsize=2), Lookup()
+        for key in ("a", "b", "c"):
+            await cache.get(key, lookup)
+
+        assert len(cache) == 2
+        assert await cache.get("c", lookup) == 3
+        assert await cache.get("a", lookup) == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_without_waiters_is_not_logged(self):
+        loop = asyncio.get_running_loop()
+        reported = []
+        loop.set_exception_handler(lambda _, context: reported.append(context))
+        cache, lookup = FutureCache(ttl=60), Lookup()
+        lookup.gate, lookup.error = asyncio.Event(), RuntimeError("down")
+
+        caller = asyncio.ensure_future(cache.get("k", lookup))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        lookup.gate.set()
+        await until(lambda: not len(cache))
+
+        del caller
+        gc.collect()
+        assert reported == []
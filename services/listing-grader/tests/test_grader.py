@@ -0,0 +1,20 @@
+"""
+Tests for ListingGrader batch grading
+"""
+
+import asyncio
+
+import pytest
+from listing_grader.grader import ListingGrader
+
+
+class TestBatch:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent", [0, -1])
+    async def test_concurrency_must_be_positive(self, max_concurrent):
+        grader = ListingGrader()
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(
+                grader.grade_batch(["1"], max_concurrent=max_concurrent), timeout=1
+            )
@@ -0,0 +1,255 @@
+"""
+Tests for ListingGraderV2 concurrent grading
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from listing_grader.grader_v2 import ListingGraderV2
+
+
+# ============================================
+# FIXTURES
+# ============================================
+
+def make_details(listing_id: str) -> SimpleNamespace:
+    """Minimal ListingDetails stand-in (no optional fields)"""
+    return SimpleNamespace(
+        airbnb_id=listing_id,
+        name=f"Cozy modern flat {listing_id}",
+        description="",
+        url="",
+        price_per_night=100,
+        cleaning_fee=20,
+        service_fee=0,
+        total_price=0,
+        currency="EUR",
+        property_type="",
+        room_type="",
+        bedrooms=1,
+        beds=1,
+        bathrooms=1,
+        max_guests=2,
+        city="Paris",
+        latitude=48.85,
+        longitude=2.35,
+        rating=4.8,
+        reviews_count=30,
+        host_id="h1",
+        host_name="H",
+        host_is_superhost=True,
+        images=["a.jpg"] * 12,
+        amenities=["Wifi", "Kitchen"],
+        scraped_at="",
+    )
+
+
+class FakeScraper:
+    """AirbnbScraper stand-in: fetches can be held on a gate or made to fail"""
+
+    def __init__(self):
+        self.fetches = []
+        self.gates = {}
+        self.errors = {}
+
+    async def get_listing_details(self, listing_id, checkin=None, checkout=None):
+        self.fetches.append(listing_id)
+        gate = self.gates.get(listing_id)
+        if gate is not None:
+            await gate.wait()
+        else:
+            await asyncio.sleep(0)
+        if listing_id in self.errors:
+            raise self.errors[listing_id]
+        return make_details(listing_id)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def scraper():
+    return FakeScraper()
+
+
+@pytest.fixture
+def grader(scraper):
+    grader = ListingGraderV2()
+    grader._scraper = scraper
+    return grader
+
+
+async def until(condition):
+    """Let other tasks run until condition() holds"""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never became true")
+
+
+# ============================================
+# SINGLE-FLIGHT GRADING
+# ============================================
+
+class TestSharedGrading:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_grades_share_one_fetch(self, grader, scraper):
+        a, b = await asyncio.gather(grader.grade("1"), grader.grade("1"))
+
+        assert a.listing_id == b.listing_id == "1"
+        assert scraper.fetches == ["1"]
+        assert grader._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_grade_returns_separate_results(self, grader, scraper):
+        a, b = await asyncio.gather(grader.grade("1"), grader.grade("1"))
+        a.recommendations.append("changed")
+        a.category_weights["reviews"] = "0%"
+
+        assert a is not b
+        assert "changed" not in b.recommendations
+        assert b.category_weights["reviews"] != "0%"
+        assert scraper.fetches == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, grader, scraper):
+        scraper.gates["1"] = asyncio.Event()
+        first = asyncio.ensure_future(grader.grade("1"))
+        await until(lambda: scraper.fetches)
+        second = asyncio.ensure_future(grader.grade("1"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        scraper.gates["1"].set()
+
+        result = await second
+        assert result.listing_id == "1"
+        assert first.cancelled()
+        assert scraper.fetches == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_grading_stops_when_every_caller_is_cancelled(self, grader, scraper):
+        scraper.gates["1"] = asyncio.Event()
+        only = asyncio.ensure_future(grader.grade("1"))
+        await until(lambda: scraper.fetches)
+
+        only.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await only
+        assert grader._inflight == {}
+
+        # A later request starts a fresh grading run
+        scraper.gates["1"].set()
+        assert (await grader.grade("1")).listing_id == "1"
+        assert scraper.fetches == ["1", "1"]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self, grader, scraper):
+        scraper.errors["1"] = RuntimeError("blocked")
+        results = await asyncio.gather(
+            grader.grade("1"), grader.grade("1"), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        assert scraper.fetches == ["1"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("radius", [0, -5])
+    async def test_market_radius_must_be_positive(self, grader, scraper, radius):
+        with pytest.raises(ValueError):
+            await grader.grade("1", compare_market=True, market_radius_km=radius)
+        assert scraper.fetches == []
+
+
+# ============================================
+# BATCHES AND STREAMS
+# ============================================
+
+class Boom(BaseException):
+    """Escapes _grade_or_none, like cancellation or KeyboardInterrupt"""
+
+
+class TestBatchAndStream:
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_input_order_and_drops_failures(self, grader, scraper):
+        scraper.gates["1"] = asyncio.Event()
+        scraper.errors["3"] = RuntimeError("gone")
+        batch = asyncio.ensure_future(
+            grader.grade_batch(["1", "2", "bad-url", "3", "4"], max_concurrent=2)
+        )
+        await until(lambda: "4" in scraper.fetches)
+        scraper.gates["1"].set()
+
+        results = await batch
+        assert [r.listing_id for r in results] == ["1", "2", "4"]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self, grader, scraper):
+        scraper.gates["1"] = asyncio.Event()
+        seen = []
+        async for result in grader.grade_stream(["1", "2", "3"], max_concurrent=3):
+            seen.append(result.listing_id)
+            if len(seen) == 2:
+                scraper.gates["1"].set()
+
+        assert sorted(seen[:2]) == ["2", "3"]
+        assert seen[2] == "1"
+
+    @pytest.mark.asyncio
+    async def test_stream_skips_failed_listings(self, grader, scraper):
+        scraper.errors["2"] = RuntimeError("gone")
+        ids = [r.listing_id async for r in grader.grade_stream(["1", "2", "bad-url", "3"])]
+
+        assert sorted(ids) == ["1", "3"]
+
+    @pytest.mark.asyncio
+    async def test_stream_early_exit_stops_grading(self, grader, scraper):
+        scraper.gates["2"] = asyncio.Event()
+        stream = grader.grade_stream(["1", "2"], max_concurrent=2)
+        async for result in stream:
+            break
+        await stream.aclose()
+        await until(lambda: not grader._inflight)
+
+        assert result.listing_id == "1"
+
+    @pytest.mark.asyncio
+    async def test_early_exit_does_not_stall_other_stream(self, grader, scraper):
+        scraper.gates["2"] = asyncio.Event()
+        first = grader.grade_stream(["1", "2"], max_concurrent=2)
+
+        async def consume_second():
+            return [r.listing_id async for r in grader.grade_stream(["2"])]
+
+        async for _ in first:
+            second = asyncio.ensure_future(consume_second())
+            await asyncio.sleep(0)
+            break
+        await first.aclose()
+        scraper.gates["2"].set()
+
+        assert await asyncio.wait_for(second, timeout=1) == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_stream_reraises_worker_failure(self, grader, scraper):
+        scraper.errors["2"] = Boom()
+
+        async def consume():
+            async for _ in grader.grade_stream(["1", "2", "3"], max_concurrent=1):
+                pass
+
+        with pytest.raises(Boom):
+            await asyncio.wait_for(consume(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_must_be_positive(self, grader):
+        with pytest.raises(ValueError):
+            await grader.grade_batch(["1"], max_concurrent=0)
+        with pytest.raises(ValueError):
+            async for _ in grader.grade_stream(["1"], max_concurrent=-1):
+                pass
@@ -2,9 +2,16 @@
 Tests for Listing Grader scoring algorithms
 """
 
+import dataclasses
+import json
+import sys
+
 import pytest
-from listing_grader.models import ListingData, GradeResult, score_to_grade
+from listing_grader.grader_v2 import GradeResultV2
+from listing_grader.models import ListingData, CategoryScore, GradeResult, score_to_grade
 from listing_grader.scorer import (
+    ListingFeatures,
+    extract_features,
     score_title,
     score_description,
     score_photos,
@@ -13,13 +20,17 @@ from listing_grader.scorer import (
     score_reviews,
     calculate_overall_score,
 )
+from listing_grader.scorer_v2 import (
+    ListingData as ListingDataV2,
+    CategoryScore as CategoryScoreV2,
+)
 
 
 # ============================================
 # FIXTURES
 # ============================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def excellent_listing():
     """A well-optimized listing"""
     return ListingData(
@@ -54,7 +65,7 @@ def excellent_listing():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def poor_listing():
     """A poorly optimized listing"""
     return ListingData(
@@ -71,7 +82,7 @@ def poor_listing():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def average_listing():
     """An average listing"""
     return ListingData(
@@ -340,6 +351,25 @@ class TestOverallScoring:
         assert instant == 0
 
 
+# ============================================
+# FEATURE EXTRACTION TESTS
+# ============================================
+
+class TestFeatureExtraction:
+    
+    def test_description_topics(self, excellent_listing, poor_listing):
+        assert extract_features(excellent_listing).desc_topics == {
+            "neighborhood", "transport", "amenities", "rules"
+        }
+        assert extract_features(poor_listing).desc_topics == set()
+    
+    def test_shared_features_match_standalone(self, excellent_listing, average_listing):
+        for listing in (excellent_listing, average_listing):
+            features = extract_features(listing)
+            for scorer in (score_title, score_description, score_amenities):
+                assert scorer(listing, features=features) == scorer(listing)
+
+
 # ============================================
 # GRADE CONVERSION TESTS
 # ============================================
@@ -367,6 +397,34 @@ class TestGradeConversion:
         assert score_to_grade(39) == "F"
 
 
+# ============================================
+# MODEL TESTS
+# ============================================
+
+def make_model(cls):
+    """Instance of a dataclass with placeholder values for required fields"""
+    required = {
+        f.name: 0 for f in dataclasses.fields(cls)
+        if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+    }
+    return cls(**required)
+
+
+class TestModelSlots:
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    @pytest.mark.parametrize("cls", [
+        ListingData, CategoryScore, GradeResult, ListingFeatures,
+        ListingDataV2, CategoryScoreV2, GradeResultV2,
+    ], ids=lambda cls: f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}")
+    def test_models_use_slots(self, cls):
+        # Catalog-wide grading keeps many of these alive; no per-instance dict
+        instance = make_model(cls)
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.unknown_field = 1
+
+
 # ============================================
 # INTEGRATION TESTS
 # ============================================
@@ -397,3 +455,20 @@ class TestIntegration:
         assert d["grade"] == "A-"
         assert d["category_scores"]["photos"] == 90
         assert "Add more photos" in d["recommendations"]
+    
+    def test_grade_result_to_json(self):
+        result = GradeResult(
+            listing_id="123",
+            listing_url="https://airbnb.com/rooms/123",
+            listing_name="Test Listing",
+            overall_score=85,
+            grade="A-",
+            title_score=80,
+            description_score=75,
+            photos_score=90,
+            pricing_score=80,
+            amenities_score=85,
+            reviews_score=88,
+        )
+        
+        assert json.loads(result.to_json()) == result.to_dict()
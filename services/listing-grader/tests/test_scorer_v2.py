@@ -0,0 +1,389 @@
+"""
+Boundary tests for the Airbnb-aligned (v2) scoring tables
+"""
+
+import pytest
+from listing_grader.scorer_v2 import (
+    ListingData,
+    score_reviews,
+    score_response,
+    score_pricing,
+    score_conversion,
+    score_instant_book,
+    score_cancellation,
+    score_listing_quality,
+    score_availability,
+    calculate_airbnb_score,
+    score_to_grade,
+    _GRADE_LUT,
+)
+
+
+def make_listing(**fields) -> ListingData:
+    return ListingData(listing_id="1", **fields)
+
+
+# Other inputs are pinned so each test sees exactly one table's points:
+# 100 reviews (30), one 5.0 sub-rating (5), 5 reviews last year (3)
+REVIEWS_BASE = dict(reviews_count=100, rating_value=5.0, reviews_last_year=5)
+
+
+def reviews(**fields):
+    return score_reviews(make_listing(**{**REVIEWS_BASE, **fields}))
+
+
+# ============================================
+# REVIEWS
+# ============================================
+
+class TestReviewTables:
+
+    @pytest.mark.parametrize("rating,points", [
+        (0, 0),
+        (3.99, 5),
+        (4.0, 10),
+        (4.49, 10),
+        (4.5, 20),
+        (4.69, 20),
+        (4.7, 28),
+        (4.79, 28),
+        (4.8, 32),
+        (4.84, 32),
+        (4.85, 35),
+        (4.89, 35),
+        (4.9, 38),
+        (4.94, 38),
+        (4.95, 40),
+        (5.0, 40),
+    ])
+    def test_rating_points(self, rating, points):
+        assert reviews(rating=rating).score == points + 38
+
+    @pytest.mark.parametrize("rating,advice", [
+        (0, "No reviews yet"),
+        (3.99, "EMERGENCY"),
+        (4.0, "URGENT"),
+        (4.5, "CRITICAL"),
+    ])
+    def test_rating_advice(self, rating, advice):
+        recs = reviews(rating=rating).recommendations
+        assert len(recs) == 1 and advice in recs[0]
+
+    def test_no_rating_advice_from_4_7(self):
+        assert reviews(rating=4.7).recommendations == []
+
+    @pytest.mark.parametrize("count,points", [
+        (0, 0),
+        (1, 2),
+        (2, 2),
+        (3, 5),
+        (4, 5),
+        (5, 10),
+        (9, 10),
+        (10, 15),
+        (19, 15),
+        (20, 20),
+        (49, 20),
+        (50, 25),
+        (99, 25),
+        (100, 30),
+    ])
+    def test_review_count_points(self, count, points):
+        assert reviews(reviews_count=count).score == points + 8
+
+    @pytest.mark.parametrize("count,advice", [
+        (0, "invisible in search"),
+        (2, "first 5 reviews"),
+        (3, "Guest Favorites eligibility"),
+        (9, "10+ reviews"),
+    ])
+    def test_review_count_advice(self, count, advice):
+        recs = reviews(reviews_count=count).recommendations
+        assert any(advice in rec for rec in recs)
+
+    def test_no_review_count_advice_from_10(self):
+        assert reviews(reviews_count=10, rating=4.95).recommendations == []
+
+    @pytest.mark.parametrize("sub_rating,points", [
+        (4.49, 1),
+        (4.5, 3),
+        (4.79, 3),
+        (4.8, 4),
+        (4.89, 4),
+        (4.9, 5),
+        (5.0, 5),
+    ])
+    def test_sub_rating_bands(self, sub_rating, points):
+        assert reviews(rating_value=sub_rating).score == 33 + points
+
+    def test_sub_rating_below_band_gets_advice(self):
+        assert reviews(rating=4.95, rating_value=4.49).recommendations == [
+            "Improve Value rating (4.49) - impacts ranking"
+        ]
+        assert reviews(rating=4.95, rating_value=4.5).recommendations == []
+
+    def test_sub_ratings_add_up(self):
+        result = reviews(
+            rating_cleanliness=4.9, rating_accuracy=4.8, rating_checkin=4.5,
+            rating_communication=4.0, rating_location=0, rating_value=5.0,
+        )
+        assert result.score == 33 + 5 + 4 + 3 + 1 + 5
+
+    @pytest.mark.parametrize("rating,points", [
+        (4.0, 10 + 10),
+        (4.49, 10 + 10),
+        (4.5, 20 + 15),
+        (4.79, 28 + 15),
+        (4.8, 32 + 20),
+        (4.89, 35 + 20),
+        (4.9, 38 + 25),
+    ])
+    def test_overall_rating_stands_in_for_missing_sub_ratings(self, rating, points):
+        assert reviews(rating=rating, rating_value=0).score == 33 + points
+
+    def test_no_fallback_without_rating(self):
+        assert reviews(rating=0, rating_value=0).score == 33
+
+
+# ============================================
+# RESPONSE
+# ============================================
+
+def response(**fields):
+    return score_response(make_listing(**fields))
+
+
+class TestResponseTables:
+
+    @pytest.mark.parametrize("rate,points", [
+        (69, 0),
+        (70, 10),
+        (79, 10),
+        (80, 20),
+        (89, 20),
+        (90, 30),
+        (94, 30),
+        (95, 35),
+        (97, 35),
+        (98, 40),
+        (100, 40),
+    ])
+    def test_response_rate_points(self, rate, points):
+        # 24h (5) and 80% acceptance (5) keep the total under the cap
+        result = response(response_rate=rate, response_time_hours=24, acceptance_rate=80)
+        assert result.score == 60 + points
+
+    @pytest.mark.parametrize("rate,advice", [
+        (69, "CRITICAL"),
+        (70, "below 80%"),
+        (89, "below 90%"),
+    ])
+    def test_response_rate_advice(self, rate, advice):
+        recs = response(response_rate=rate).recommendations
+        assert len(recs) == 1 and advice in recs[0]
+
+    @pytest.mark.parametrize("hours,points", [
+        (0, 40),
+        (0.5, 40),
+        (0.51, 35),
+        (1, 35),
+        (1.5, 30),
+        (2, 30),
+        (2.5, 20),
+        (6, 20),
+        (6.1, 10),
+        (12, 10),
+        (12.5, 5),
+        (24, 5),
+        (24.1, 0),
+    ])
+    def test_response_time_points(self, hours, points):
+        result = response(response_rate=69, response_time_hours=hours, acceptance_rate=80)
+        assert result.score == 55 + points
+
+    @pytest.mark.parametrize("hours,advice", [
+        (6, None),
+        (6.1, "within 1 hour"),
+        (12, "within 1 hour"),
+        (12.5, "over 12h"),
+        (24, "over 12h"),
+        (24.1, "over 24h"),
+    ])
+    def test_response_time_advice(self, hours, advice):
+        recs = response(response_time_hours=hours).recommendations
+        if advice is None:
+            assert recs == []
+        else:
+            assert len(recs) == 1 and advice in recs[0]
+
+    @pytest.mark.parametrize("rate,points,advised", [
+        (69, 0, True),
+        (70, 0, False),
+        (79, 0, False),
+        (80, 5, False),
+        (89, 5, False),
+        (90, 8, False),
+        (94, 8, False),
+        (95, 10, False),
+    ])
+    def test_acceptance_rate_points(self, rate, points, advised):
+        result = response(acceptance_rate=rate, response_time_hours=24.1, response_rate=98)
+        assert result.score == 90 + points
+        assert any("acceptance" in rec for rec in result.recommendations) == advised
+
+
+# ============================================
+# AVAILABILITY
+# ============================================
+
+def availability(**fields):
+    # Stale calendar (-20) and nothing else scored unless asked for
+    base = dict(
+        calendar_updated=False, availability_days_30=0,
+        availability_days_90=0, min_nights=4,
+    )
+    return score_availability(make_listing(**{**base, **fields}))
+
+
+class TestAvailabilityTables:
+
+    @pytest.mark.parametrize("days,points", [
+        (6, 0),
+        (7, 5),
+        (14, 5),
+        (15, 10),
+        (24, 10),
+        (25, 15),
+        (30, 15),
+    ])
+    def test_30_day_points(self, days, points):
+        result = availability(availability_days_30=days)
+        assert result.score == 30 + points
+        assert any("Open more dates" in rec for rec in result.recommendations) == (days < 7)
+
+    @pytest.mark.parametrize("days,points", [
+        (29, 0),
+        (30, 10),
+        (59, 10),
+        (60, 15),
+        (90, 15),
+    ])
+    def test_90_day_points(self, days, points):
+        assert availability(availability_days_90=days, availability_days_30=7).score == 35 + points
+
+    @pytest.mark.parametrize("nights,points", [
+        (-1, 5),
+        (0, 5),
+        (1, 10),
+        (2, 8),
+        (3, 5),
+        (4, 0),
+        (5, 0),
+        (6, 0),
+        (7, 0),
+        (8, 0),
+    ])
+    def test_min_nights_points(self, nights, points):
+        result = availability(min_nights=nights, availability_days_30=7)
+        assert result.score == 35 + points
+        advised = any("minimum nights" in rec for rec in result.recommendations)
+        assert advised == (nights > 7)
+
+
+# ============================================
+# GRADES
+# ============================================
+
+class TestGradeConversion:
+
+    @pytest.mark.parametrize("score,grade", [
+        (-1, "F"),
+        (0, "F"),
+        (39, "F"),
+        (39.9, "F"),
+        (40, "D-"),
+        (44, "D-"),
+        (45, "D"),
+        (50, "D+"),
+        (55, "C-"),
+        (60, "C"),
+        (65, "C+"),
+        (70, "B-"),
+        (75, "B"),
+        (80, "B+"),
+        (84.9, "B+"),
+        (85, "A-"),
+        (90, "A"),
+        (94, "A"),
+        (95, "A+"),
+        (100, "A+"),
+        (101, "A+"),
+    ])
+    def test_grade_edges(self, score, grade):
+        assert score_to_grade(score) == grade
+
+    def test_lookup_table_covers_0_to_100(self):
+        assert len(_GRADE_LUT) == 101
+        assert _GRADE_LUT[0] == "F" and _GRADE_LUT[100] == "A+"
+        # Grades only ever improve as the score rises
+        order = ["F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
+        ranks = [order.index(g) for g in _GRADE_LUT]
+        assert ranks == sorted(ranks)
+
+
+# ============================================
+# AGGREGATE
+# ============================================
+
+_PRIORITY = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def expected_recommendations(listing):
+    """All category recommendations, stably sorted by priority"""
+    cats = [
+        score_reviews(listing), score_response(listing), score_pricing(listing),
+        score_conversion(listing), score_instant_book(listing),
+        score_cancellation(listing), score_listing_quality(listing),
+        score_availability(listing),
+    ]
+    recs = [(cat.priority, rec) for cat in cats for rec in cat.recommendations]
+    recs.sort(key=lambda r: _PRIORITY.get(r[0], 4))
+    return [rec for _, rec in recs]
+
+
+class TestAggregate:
+
+    def test_recommendations_by_priority_capped_at_10(self):
+        listing = make_listing(
+            rating=3.5, reviews_count=2, rating_value=4.0,
+            response_rate=60, response_time_hours=30, acceptance_rate=60,
+            calendar_updated=False, availability_days_30=3, min_nights=10,
+        )
+        expected = expected_recommendations(listing)
+        assert len(expected) > 10
+
+        assert calculate_airbnb_score(listing)["recommendations"] == expected[:10]
+
+    def test_short_recommendation_list_kept_whole(self):
+        listing = make_listing(
+            rating=4.95, reviews_count=120, rating_value=5.0, reviews_last_year=12,
+            price_per_night=100, instant_bookable=True, is_superhost=True,
+            images=["a.jpg"] * 25, amenities=["Wifi"] * 40,
+            name="Bright loft near the canal with rooftop terrace",
+            description="x" * 1000,
+        )
+        expected = expected_recommendations(listing)
+        assert len(expected) < 10
+
+        assert calculate_airbnb_score(listing)["recommendations"] == expected
+
+    @pytest.mark.parametrize("favorite,percentile,bonus", [
+        (False, 1, 0),
+        (True, 1, 12),
+        (True, 5, 10),
+        (True, 0, 8),
+        (True, 10, 8),
+    ])
+    def test_guest_favorite_bonus(self, favorite, percentile, bonus):
+        listing = make_listing(is_guest_favorite=favorite, guest_favorite_percentile=percentile)
+        assert calculate_airbnb_score(listing)["bonuses"]["guest_favorites"] == bonus
@@ -2,11 +2,15 @@
 Shared data models for HostTools services
 """
 
+import re
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
 
+_LISTING_ID_RE = re.compile(r'/rooms/(\d+)')
+
+
 class ListingInput(BaseModel):
     """Input for listing analysis"""
     url: str = Field(..., description="Airbnb listing URL")
@@ -14,8 +18,7 @@ class ListingInput(BaseModel):
     @property
     def listing_id(self) -> str:
         """Extract listing ID from URL"""
-        import re
-        match = re.search(r'/rooms/(\d+)', self.url)
+        match = _LISTING_ID_RE.search(self.url)
         return match.group(1) if match else ""
 
 